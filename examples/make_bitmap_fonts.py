@@ -0,0 +1,43 @@
+#!/usr/bin/python
+"""
+One-time generator for pre-rendered PIL bitmap fonts.
+
+Rasterizes the ASCII range of DejaVuSans at every size stocks.py uses
+into PIL's native .pil/.pbm format under /home/chinmay/fonts/. Drawing
+with ImageFont.load() is then a plain bit-copy — no FreeType glyph
+rasterization on the Pi at render time. All displayed text is
+ASCII/digits, so the limited coverage is fine.
+"""
+
+import math
+import os
+from PIL import FontFile, Image, ImageDraw, ImageFont
+
+font_dir = '/home/chinmay/fonts'
+font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+sizes = [10, 11, 15, 16]  # keep in sync with stocks.py
+
+
+class TruetypeBitmapFont(FontFile.FontFile):
+    """Rasterize a TrueType font's ASCII glyphs into a PIL bitmap font."""
+
+    def __init__(self, font):
+        super().__init__()
+        ascent, descent = font.getmetrics()
+        cell_h = ascent + descent
+        for i in range(32, 127):
+            ch = chr(i)
+            w = max(int(math.ceil(font.getlength(ch))), 1)
+            im = Image.new('1', (w, cell_h), 0)
+            ImageDraw.Draw(im).text((0, 0), ch, font=font, fill=255)
+            # advance, destination, source, glyph image
+            self.glyph[i] = ((w, 0), (0, 0, w, cell_h), (0, 0, w, cell_h), im)
+
+
+os.makedirs(font_dir, exist_ok=True)
+for size in sizes:
+    ttf = ImageFont.truetype(font_path, size)
+    bitmap = TruetypeBitmapFont(ttf)
+    out = os.path.join(font_dir, f'dejavu-{size}')
+    bitmap.save(out + '.pil')
+    print(f"Wrote {out}.pil / {out}.pbm")
@@ -0,0 +1,41 @@
+#!/usr/bin/python
+"""
+One-time generator for the static stocks.py background.
+
+Renders the parts of the frame that never change between wakeups — the
+header bar with the "Minion" label, the column divider, and the footer
+bar — into a 1-bit BMP that stocks.py composites the live prices onto.
+Rerun after changing the layout; keep the geometry in sync with stocks.py.
+"""
+
+from PIL import Image, ImageDraw, ImageFont
+
+bg_file = '/home/chinmay/stocks_bg.bmp'
+
+# Panel dimensions of the Waveshare 2.13 V4 (landscape: height x width)
+EPD_WIDTH = 122
+EPD_HEIGHT = 250
+
+font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+font_title = ImageFont.truetype(font_path, 16)
+
+# Layout (keep in sync with stocks.py)
+y_start = 28
+y_spacing = 20
+line_y = y_start + 2 * y_spacing + 10
+
+image = Image.new('1', (EPD_HEIGHT, EPD_WIDTH), 255)
+draw = ImageDraw.Draw(image)
+
+# Header
+draw.rectangle((0, 0, EPD_HEIGHT, 22), fill=0)
+draw.text((5, 4), "Minion", font=font_title, fill=255)
+
+# Divider
+draw.line((0, line_y, EPD_HEIGHT, line_y), fill=0, width=1)
+
+# Footer
+draw.rectangle((0, EPD_WIDTH - 16, EPD_HEIGHT, EPD_WIDTH), fill=0)
+
+image.save(bg_file)
+print(f"Wrote {bg_file}")
@@ -4,8 +4,9 @@
 - Log all operations to /home/chinmay/stocks.log.
 - Put the display to sleep.
 - Calculate and set the next RTC wakeup at either 7:00 AM or 7:00 PM, whichever is next.
-- Wait for 1 minute.
-- Shutdown the system cleanly, with an exception of suspected manual boot.
+- Schedule shutdown in 1 minute and exit immediately, with an exception of
+  suspected manual boot. The grace minute is shutdown's own timer, so no
+  Python process stays resident while it counts down.
 
 Displays:
 - Bitcoin price (header)
@@ -17,10 +18,14 @@ Displays:
 import os
 import time
 import json
+import socket
+from hashlib import blake2b
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
 from lib.waveshare_epd import epd2in13_V4
-import yfinance as yf
+import requests
+from requests.adapters import HTTPAdapter
 import logging
 
 # Logging
@@ -32,32 +37,114 @@ logging.basicConfig(
 
 # Fonts
 font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-font_title = ImageFont.truetype(font_path, 16)
-font_main = ImageFont.truetype(font_path, 15)
-font_footer = ImageFont.truetype(font_path, 11)
-font_ratios = ImageFont.truetype(font_path, 10)
+bitmap_font_dir = '/home/chinmay/fonts'  # generated by make_bitmap_fonts.py
+
+def load_font(size):
+    """Prefer the pre-rendered bitmap font: drawing it is a plain bit-copy,
+    with no FreeType rasterization per call. Fall back to TrueType."""
+    try:
+        return ImageFont.load(f'{bitmap_font_dir}/dejavu-{size}.pil')
+    except Exception:
+        return ImageFont.truetype(font_path, size)
+
+font_title = load_font(16)
+font_main = load_font(15)
+font_footer = load_font(11)
+font_ratios = load_font(10)
 
 # Tickers
 tickers = ['VTI', 'GLD', 'PSTG', 'ORCL']
 btc_symbol = 'BTC-USD'
 cache_file = '/home/chinmay/stock_cache.json'
+frame_state_file = '/home/chinmay/frame_state.json'
+bg_file = '/home/chinmay/stocks_bg.bmp'  # generated by render_background.py
+yf_bootstrap_file = '/home/chinmay/.yf_crumb.json'
+
+YF_BOOTSTRAP_TTL = 24 * 3600  # Yahoo crumbs stay valid for about a day
+
+FULL_REFRESH_EVERY = 10  # partial updates between full refreshes, limits ghosting
+
+CACHE_TTL = 300  # seconds; quotes younger than this skip the network entirely
+
+def load_cache():
+    """Load {sym: {"price": float, "ts": epoch}}, tolerating older formats."""
+    if not os.path.exists(cache_file):
+        return {}
+    try:
+        with open(cache_file, 'r') as f:
+            raw = json.load(f)
+    except Exception as e:
+        logging.error(f"Failed to load cache: {e}")
+        return {}
+    out = {}
+    for sym, v in raw.items():
+        # Older versions stored bare price strings; treat those as stale.
+        if not isinstance(v, dict):
+            v = {"price": v, "ts": 0}
+        try:
+            v["price"] = float(v["price"])
+        except (TypeError, ValueError):
+            continue
+        out[sym] = v
+    return out
+
+def load_frame_state():
+    try:
+        with open(frame_state_file, 'r') as f:
+            return json.load(f)
+    except Exception:
+        return {}
 
-# Load old cache
-if os.path.exists(cache_file):
-    with open(cache_file, 'r') as f:
-        last_values = json.load(f)
-else:
-    last_values = {}
+def save_frame_state(state):
+    try:
+        with open(frame_state_file, 'w') as f:
+            json.dump(state, f)
+    except Exception as e:
+        logging.error(f"Failed to save frame state: {e}")
 
-btc_ticker = yf.Ticker(btc_symbol)
-ticker_objs = {t: yf.Ticker(t) for t in tickers}
+symbols = tickers + [btc_symbol]
 
 MORNING_HOUR = 7
 EVENING_HOUR = 19
+MAX_RETRIES = 5
+FETCH_TIMEOUT = 10  # seconds; a stalled fetch must not eat the shutdown window
+SPARK_URL = "https://query1.finance.yahoo.com/v8/finance/spark"
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies FETCH_TIMEOUT when no timeout is given.
+
+    yfinance issues its requests without one, and a half-open socket
+    blocks its worker thread past every executor deadline -- the adapter
+    bounds the read itself, whichever exit path the script takes.
+    """
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = FETCH_TIMEOUT
+        return super().send(request, **kwargs)
+
+# One pooled session shared by the spark fetch and the yfinance fallbacks:
+# keep-alive connections skip a fresh TLS handshake per request, including
+# across the fallback pool's threads.
+http_session = requests.Session()
+http_session.mount('https://', TimeoutHTTPAdapter(pool_connections=1, pool_maxsize=8))
+
+def pisugar_cmd(cmd):
+    """Send one command to the PiSugar server over its TCP socket.
+
+    A raw socket avoids forking sh/echo/nc for every battery or RTC call.
+    """
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        s.settimeout(2)
+        s.connect(('127.0.0.1', 8423))
+        s.sendall(cmd.encode() + b'\n')
+        return s.recv(256).decode().strip()
+    finally:
+        s.close()
 
 def get_battery_percentage():
     try:
-        result = os.popen('echo "get battery" | nc -q 0 127.0.0.1 8423').read().strip()
+        result = pisugar_cmd('get battery')
         logging.info(f"Raw battery response: {result}")
         if "battery:" in result:
             battery_value = result.split(":")[1].strip()
@@ -68,144 +155,368 @@ def get_battery_percentage():
         logging.error(f"Failed to get battery: {e}")
         return "N/A"
 
-def is_am(now=None):
-    if now is None:
-        now = datetime.now()
-    return 0 <= now.hour < 12
+def load_yf_bootstrap():
+    """Inject a cached Yahoo cookie/crumb into the shared session so
+    yfinance can skip its /getcrumb bootstrap round-trip.
 
-try:
-    epd = epd2in13_V4.EPD()
-    epd.init()
+    Best effort on both ends: yfinance internals move between releases,
+    so any failure just means a fresh bootstrap.
+    """
+    try:
+        with open(yf_bootstrap_file, 'r') as f:
+            blob = json.load(f)
+        if time.time() - blob['ts'] > YF_BOOTSTRAP_TTL:
+            return
+        http_session.cookies.update(blob['cookies'])
+        import yfinance as yf
+        yf.data.YfData(session=http_session)._crumb = blob['crumb']
+        logging.info("Reusing cached Yahoo cookie/crumb")
+    except Exception as e:
+        logging.debug(f"No usable yfinance bootstrap cache: {e}")
+
+def save_yf_bootstrap():
+    try:
+        import yfinance as yf
+        crumb = yf.data.YfData(session=http_session)._crumb
+        if not crumb:
+            return
+        with open(yf_bootstrap_file, 'w') as f:
+            json.dump({'cookies': http_session.cookies.get_dict(),
+                       'crumb': crumb, 'ts': time.time()}, f)
+    except Exception as e:
+        logging.debug(f"Could not save yfinance bootstrap cache: {e}")
 
-    logging.info("Fetching ticker data...")
-    MAX_RETRIES = 5
+def frame_buffer(epd, image):
+    """Pack the landscape 1-bit frame into the panel's byte layout.
+
+    numpy does the rotate and the 8-pixels-per-byte pack in C in one
+    shot, producing the same bytes as epd.getbuffer(), which remains the
+    fallback when numpy is unavailable.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return epd.getbuffer(image)
+    if image.size != (epd.height, epd.width):
+        return epd.getbuffer(image)
+    arr = np.asarray(image, dtype=np.uint8)
+    return bytearray(np.packbits(np.rot90(arr, 1), axis=1).tobytes())
+
+def fmt(value, spec='.2f'):
+    """Format an Optional[float] for display; None renders as N/A."""
+    return format(value, spec) if value is not None else "N/A"
+
+def fetch_one(sym):
+    """Fetch the latest 1-minute close for one symbol.
+
+    Single attempt, no backoff: the spark and batch layers in front have
+    already retried by the time this runs, and sleeping here would keep a
+    worker thread pinning the interpreter past the pool's deadline.
+    """
+    import yfinance as yf
+    try:
+        data = yf.Ticker(sym, session=http_session).history(period="1d", interval="1m")
+        # Yahoo's most recent 1-minute bar is often NaN; drop those like
+        # fetch_batch does so None stays the only "missing" sentinel.
+        closes = data['Close'].dropna()
+        if len(closes):
+            return sym, closes.iat[-1]
+    except Exception as e:
+        logging.warning(f"Fetch for ticker {sym} failed: {e}")
+    return sym, None
+
+def fetch_spark(syms):
+    """Fetch the latest prices for all symbols from Yahoo's spark endpoint.
+
+    Much lighter than yfinance's history(): one HTTP request for every
+    symbol and no pandas DataFrame built just to read the last close.
+    """
+    resp = http_session.get(
+        SPARK_URL,
+        params={'symbols': ','.join(syms), 'range': '1d', 'interval': '1m'},
+        headers={'User-Agent': 'Mozilla/5.0'},
+        timeout=5,
+    )
+    resp.raise_for_status()
+    out = {}
+    for blob in resp.json()['spark']['result']:
+        price = blob['response'][0]['meta'].get('regularMarketPrice')
+        if price is not None:
+            out[blob['symbol']] = price
+    return out
+
+def fetch_batch(syms):
+    """Fetch the latest 1-minute closes for all symbols in one download.
+
+    A single Tickers group shares one session (and one cookie/crumb
+    bootstrap) across every symbol instead of warming up per ticker.
+    """
+    import yfinance as yf
+    group = yf.Tickers(" ".join(syms), session=http_session)
+    df = group.download(period="1d", interval="1m", group_by='ticker',
+                        progress=False, threads=True)
+    out = {}
+    for sym in syms:
+        closes = df[sym]['Close'].dropna()
+        if len(closes):
+            out[sym] = closes.iat[-1]
+    return out
+
+def fetch_quotes():
+    """Fetch all quotes, falling back through yfinance and then the cache.
+
+    Returns (quotes, btc_price, used_fallback) with quotes as
+    Optional[float] per ticker; used_fallback marks stale cached data.
+    """
+    last_values = load_cache()
     quotes = {}
     used_fallback = False
+    results = {}
 
-    for t in tickers:
-        success = False
+    cache_fresh = all(
+        s in last_values and time.time() - last_values[s]['ts'] < CACHE_TTL
+        for s in symbols
+    )
+
+    if cache_fresh:
+        logging.info("Cache is fresh, skipping network fetch")
+    else:
+        logging.info("Fetching ticker data...")
+
+        # One spark request covers every symbol; Yahoo accepts up to 20.
         for attempt in range(MAX_RETRIES):
             try:
-                data = ticker_objs[t].history(period="1d", interval="1m")
-                if not data.empty:
-                    latest = data.tail(1)
-                    quotes[t] = f"{latest['Close'][0]:.2f}"
-                    success = True
+                results = fetch_spark(symbols)
+                if results:
                     break
             except Exception as e:
-                logging.warning(f"Retry {attempt + 1} for ticker {t} failed: {e}")
+                logging.warning(f"Retry {attempt + 1} for spark fetch failed: {e}")
             time.sleep(2 ** attempt)
-        if not success:
-            quotes[t] = last_values.get(t, "N/A")
-            if quotes[t] != "N/A":
+
+        # yfinance batch fallback for anything the spark call missed.
+        # Both fallbacks run through futures with a deadline: yfinance has
+        # no timeout of its own, and a half-open connection would otherwise
+        # pin the script past its shutdown window.
+        missing = [s for s in symbols if s not in results]
+        used_yfinance = bool(missing)
+        if missing:
+            logging.warning(f"Spark fetch missed {missing}, trying batch download")
+            load_yf_bootstrap()
+            executor = ThreadPoolExecutor(max_workers=1)
+            try:
+                results.update(executor.submit(fetch_batch, missing).result(timeout=FETCH_TIMEOUT))
+            except Exception as e:
+                logging.warning(f"Batch download failed: {e}")
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Last resort: per-ticker fetches in a pool.
+        missing = [s for s in symbols if s not in results]
+        if missing:
+            logging.warning(f"Batch download missed {missing}, fetching individually")
+            executor = ThreadPoolExecutor(max_workers=len(missing))
+            futures = [executor.submit(fetch_one, s) for s in missing]
+            try:
+                for future in as_completed(futures, timeout=FETCH_TIMEOUT):
+                    sym, price = future.result()
+                    if price is not None:
+                        results[sym] = price
+            except Exception as e:
+                logging.warning(f"Per-ticker fetches timed out, using cache: {e}")
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if used_yfinance:
+            save_yf_bootstrap()
+
+    # Quotes stay Optional[float] (None = missing) until draw time.
+    for t in tickers:
+        quotes[t] = results.get(t)
+        if quotes[t] is None:
+            quotes[t] = last_values.get(t, {}).get('price')
+            if quotes[t] is not None and not cache_fresh:
                 used_fallback = True
 
     # Bitcoin price
-    success = False
-    for attempt in range(MAX_RETRIES):
-        try:
-            btc_data = btc_ticker.history(period="1d", interval="1m")
-            if not btc_data.empty:
-                btc_latest = btc_data.tail(1)
-                btc_price = f"{btc_latest['Close'][0]:.0f}"
-                success = True
-                break
-        except Exception as e:
-            logging.warning(f"Retry {attempt + 1} for BTC-USD failed: {e}")
-        time.sleep(2 ** attempt)
-    if not success:
-        btc_price = last_values.get(btc_symbol, "N/A")
-        if btc_price != "N/A":
+    btc_price = results.get(btc_symbol)
+    if btc_price is None:
+        btc_price = last_values.get(btc_symbol, {}).get('price')
+        if btc_price is not None and not cache_fresh:
             used_fallback = True
 
-    # Save cache only for valid values
+    # Save freshly fetched values; keep older entries (and their age) as-is.
     try:
-        cache_to_save = {}
+        cache_to_save = dict(last_values)
+        fetched_at = time.time()
         for t in tickers:
-            if quotes[t] != "N/A":
-                cache_to_save[t] = quotes[t]
-        if btc_price != "N/A":
-            cache_to_save[btc_symbol] = btc_price
+            if results.get(t) is not None:
+                cache_to_save[t] = {"price": quotes[t], "ts": fetched_at}
+        if results.get(btc_symbol) is not None:
+            cache_to_save[btc_symbol] = {"price": btc_price, "ts": fetched_at}
         if cache_to_save:
             with open(cache_file, 'w') as f:
                 json.dump(cache_to_save, f)
     except Exception as e:
         logging.error(f"Failed to save cache: {e}")
 
-    # Ratios
-    try:
-        vti_to_gld = round(float(quotes['VTI']) / float(quotes['GLD']), 2) if quotes['VTI'] != "N/A" and quotes['GLD'] != "N/A" else "N/A"
-        pstg_to_vti = round(float(quotes['PSTG']) / float(quotes['VTI']), 2) if quotes['PSTG'] != "N/A" and quotes['VTI'] != "N/A" else "N/A"
-        orcl_to_vti = round(float(quotes['ORCL']) / float(quotes['VTI']), 2) if quotes['ORCL'] != "N/A" and quotes['VTI'] != "N/A" else "N/A"
-    except ValueError:
-        vti_to_gld = pstg_to_vti = orcl_to_vti = "N/A"
-
-    # Image drawing
-    image = Image.new('1', (epd.height, epd.width), 255)
-    draw = ImageDraw.Draw(image)
+    return quotes, btc_price, used_fallback
 
-    # Header
-    draw.rectangle((0, 0, epd.height, 22), fill=0)
-    draw.text((5, 4), "Minion", font=font_title, fill=255)
-    btc_text_width, _ = draw.textsize(btc_price, font=font_title)
-    draw.text((epd.height - btc_text_width - 15, 4), f"${btc_price}", font=font_title, fill=255)
+def render_frame(epd, quotes, btc_price, used_fallback, now):
+    """Draw one frame and return it as a PIL image."""
+    # Ratios
+    vti_to_gld = round(quotes['VTI'] / quotes['GLD'], 2) if quotes['VTI'] and quotes['GLD'] else None
+    pstg_to_vti = round(quotes['PSTG'] / quotes['VTI'], 2) if quotes['PSTG'] and quotes['VTI'] else None
+    orcl_to_vti = round(quotes['ORCL'] / quotes['VTI'], 2) if quotes['ORCL'] and quotes['VTI'] else None
 
-    # Stocks
+    # Layout (keep in sync with render_background.py)
     left_x = 10
     right_x = int(epd.height / 2) + 5
     y_start = 28
     y_spacing = 20
+    line_y = y_start + 2 * y_spacing + 10
+
+    # Image drawing: the static chrome (header bar, divider, footer bar)
+    # comes pre-rendered from disk when available; only dynamic fields
+    # get rasterized per run.
+    if os.path.exists(bg_file):
+        image = Image.open(bg_file).convert('1')
+        draw = ImageDraw.Draw(image)
+    else:
+        image = Image.new('1', (epd.height, epd.width), 255)
+        draw = ImageDraw.Draw(image)
+        draw.rectangle((0, 0, epd.height, 22), fill=0)
+        draw.text((5, 4), "Minion", font=font_title, fill=255)
+        draw.line((0, line_y, epd.height, line_y), fill=0, width=1)
+        draw.rectangle((0, epd.width - 16, epd.height, epd.width), fill=0)
 
+    # Header
+    btc_text = f"${fmt(btc_price, '.0f')}"
+    btc_text_width, _ = draw.textsize(btc_text, font=font_title)
+    draw.text((epd.height - btc_text_width - 15, 4), btc_text, font=font_title, fill=255)
+
+    # Stocks
     for i, t in enumerate(tickers[:2]):
-        draw.text((left_x, y_start + i * y_spacing), f"{t}: ${quotes[t]}", font=font_main, fill=0)
+        draw.text((left_x, y_start + i * y_spacing), f"{t}: ${fmt(quotes[t])}", font=font_main, fill=0)
 
     for i, t in enumerate(tickers[2:]):
-        draw.text((right_x, y_start + i * y_spacing), f"{t}: ${quotes[t]}", font=font_main, fill=0)
-
-    # Divider
-    line_y = y_start + 2 * y_spacing + 10
-    draw.line((0, line_y, epd.height, line_y), fill=0, width=1)
+        draw.text((right_x, y_start + i * y_spacing), f"{t}: ${fmt(quotes[t])}", font=font_main, fill=0)
 
     # Ratios
     ratios_y_start = line_y + 5
     col_width = epd.height // 3
-    draw.text((10, ratios_y_start), f"VTI/GLD: {vti_to_gld}", font=font_ratios, fill=0)
-    draw.text((col_width + 5, ratios_y_start), f"PSTG/VTI: {pstg_to_vti}", font=font_ratios, fill=0)
-    draw.text((2 * col_width + 5, ratios_y_start), f"ORCL/VTI: {orcl_to_vti}", font=font_ratios, fill=0)
+    draw.text((10, ratios_y_start), f"VTI/GLD: {fmt(vti_to_gld)}", font=font_ratios, fill=0)
+    draw.text((col_width + 5, ratios_y_start), f"PSTG/VTI: {fmt(pstg_to_vti)}", font=font_ratios, fill=0)
+    draw.text((2 * col_width + 5, ratios_y_start), f"ORCL/VTI: {fmt(orcl_to_vti)}", font=font_ratios, fill=0)
 
     # Footer
-    timestamp = datetime.now().strftime("%b %d %I:%M:%S %p")
+    # Minute resolution: keeps re-runs within the same minute byte-identical
+    # so the unchanged-frame check below can skip the refresh.
+    timestamp = now.strftime("%b %d %I:%M %p")
     battery_percent = get_battery_percentage()
     footer_text = f"{timestamp}{'*' if used_fallback else ''} | {battery_percent}%"
     footer_text_width, _ = draw.textsize(footer_text, font=font_footer)
     footer_x = (epd.height - footer_text_width) // 2
 
-    draw.rectangle((0, epd.width - 16, epd.height, epd.width), fill=0)
     draw.text((footer_x, epd.width - 14), footer_text, font=font_footer, fill=255)
 
-    epd.display(epd.getbuffer(image))
-
-except Exception as e:
-    logging.error(f"Failed to update display: {e}")
+    return image
+
+# displayPartial diffs against the controller's previous-frame RAM, which
+# is wiped whenever the panel loses power -- and epd.sleep() ends every
+# refresh by powering it off via module_exit (only the pigment survives).
+# None means the RAM is unseeded and the next update must be a full
+# refresh; partials are only safe for repeat updates while the panel has
+# stayed awake.
+_cycles_since_full = None
+
+def update_display(epd, buf, frame_state, frame_hash):
+    """Push a packed frame to the already-initialized panel.
+
+    The first update after any panel power-off is a full refresh to seed
+    the controller RAM; only repeat updates while the panel stays awake
+    may use partial refresh, with a full refresh every FULL_REFRESH_EVERY
+    cycles to clear ghosting. Since refresh() sleeps the panel after each
+    update, both the one-shot script and the daemon currently take the
+    full-refresh path every time.
+    """
+    global _cycles_since_full
+    if _cycles_since_full is None or _cycles_since_full >= FULL_REFRESH_EVERY:
+        epd.display(buf)
+        _cycles_since_full = 0
+    else:
+        # RAM already seeded this power cycle: ~300 ms and no flash.
+        epd.displayPartial(buf)
+        _cycles_since_full += 1
+    frame_state['hash'] = frame_hash
+    save_frame_state(frame_state)
+
+def refresh(now):
+    """One fetch-render-display cycle; leaves the panel asleep afterwards."""
+    global _cycles_since_full
+    epd_initialized = False
+    try:
+        epd = epd2in13_V4.EPD()
+        quotes, btc_price, used_fallback = fetch_quotes()
+        image = render_frame(epd, quotes, btc_price, used_fallback, now)
+        buf = frame_buffer(epd, image)
+        frame_state = load_frame_state()
+        frame_hash = blake2b(bytes(buf), digest_size=16).hexdigest()
+        if frame_state.get('hash') == frame_hash:
+            # Same pixels as last run; the panel still shows them, so
+            # don't even wake it up.
+            logging.info("Frame unchanged, skipping display update")
+        else:
+            epd.init()
+            # Flag the wake before writing the frame: if the SPI write
+            # fails, finally must still put the panel back to sleep.
+            epd_initialized = True
+            update_display(epd, buf, frame_state, frame_hash)
+    except Exception as e:
+        logging.error(f"Failed to update display: {e}")
+    finally:
+        if epd_initialized:
+            logging.info("Putting display to sleep.")
+            epd.sleep()
+            # sleep() cuts panel power, wiping the previous-frame RAM that
+            # partial refresh diffs against; force a full refresh next time.
+            _cycles_since_full = None
+
+def set_rtc_wakeup(now_ts):
+    """Point the PiSugar RTC alarm at the next 7:00/19:00 boundary.
+
+    Pure epoch arithmetic: the two boundaries are 12 h apart, so the next
+    one is a single modulo away -- no datetime objects or timezone
+    replace/isoformat chain.
+    """
+    tm = time.localtime(now_ts)
+    secs_today = tm.tm_hour * 3600 + tm.tm_min * 60 + tm.tm_sec
+    wait = (MORNING_HOUR * 3600 - secs_today) % (12 * 3600) or 12 * 3600
+    wake = time.localtime(now_ts + wait)
+    # PiSugar wants ISO 8601 with a colon in the offset; %z omits it.
+    tz = time.strftime('%z', wake)
+    waketime_str = time.strftime('%Y-%m-%dT%H:%M:%S', wake) + tz[:3] + ':' + tz[3:]
 
-finally:
-    logging.info("Putting display to sleep.")
-    epd.sleep()
+    logging.info(f"Setting RTC wakeup for {waketime_str}")
+    try:
+        response = pisugar_cmd(f'rtc_alarm_set {waketime_str} 127')
+        logging.info(f"RTC alarm response: {response}")
+    except Exception as e:
+        logging.error(f"Failed to set RTC alarm: {e}")
 
+def main():
+    # Single wall-clock capture for the whole run: one clock_gettime
+    # syscall, and no hour-boundary race between the footer and the RTC
+    # computation.
     now = datetime.now().astimezone()
-    morning_waketime = now.replace(hour=MORNING_HOUR, minute=0, second=0, microsecond=0)
-    evening_waketime = now.replace(hour=EVENING_HOUR, minute=0, second=0, microsecond=0)
 
-    waketime_str = morning_waketime.isoformat()
-    if is_am():
-        waketime_str = evening_waketime.isoformat()
-
-    logging.info(f"Setting RTC wakeup for {waketime_str}")
-    response = os.popen(f'echo "rtc_alarm_set {waketime_str} 127" | nc -q 0 127.0.0.1 8423').read().strip()
-    logging.info(f"RTC alarm response: {response}")
+    refresh(now)
+    set_rtc_wakeup(now.timestamp())
 
     if now.hour == MORNING_HOUR or now.hour == EVENING_HOUR:
-        logging.info("Shutting down system.")
-        os.system("sudo /sbin/shutdown -h now")
+        logging.info("Scheduling shutdown in 1 minute and exiting.")
+        # execvp replaces this interpreter: shutdown's timer does the
+        # waiting instead of a resident Python process.
+        os.execvp('sudo', ['sudo', '/sbin/shutdown', '-h', '+1'])
     else:
         logging.info("Possible manual boot up, not shutting down")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/python
+"""
+Long-lived alternative to the RTC wake/shutdown cycle in stocks.py.
+
+One resident Python process pays the pandas/PIL import cost a single
+time and then refreshes the display at the same 7:00/19:00 boundaries,
+sleeping in between. Worth running (e.g. as a systemd service) when the
+Pi is on mains power and per-wakeup interpreter cold-start dominates;
+battery setups should keep the stocks.py shutdown cycle instead.
+"""
+
+import os
+import sys
+import time
+import logging
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+import stocks
+
+
+def seconds_until_next_refresh(now):
+    targets = [now.replace(hour=h, minute=0, second=0, microsecond=0)
+               for h in (stocks.MORNING_HOUR, stocks.EVENING_HOUR)]
+    upcoming = [t for t in targets if t > now]
+    if not upcoming:
+        upcoming = [targets[0] + timedelta(days=1)]
+    return (min(upcoming) - now).total_seconds()
+
+
+def main():
+    logging.info("stocks daemon starting")
+    while True:
+        now = datetime.now().astimezone()
+        stocks.refresh(now)
+        delay = seconds_until_next_refresh(datetime.now().astimezone())
+        logging.info(f"Sleeping {delay:.0f}s until next refresh")
+        time.sleep(delay)
+
+
+if __name__ == '__main__':
+    main()